@@ -50,6 +50,7 @@ cfg_options_parse_comma_sep_names = True
 #cfg_options_table_add_header = True
 # cfg_options_default_in_summary_table = True
 # cfg_options_unique = True
+cfg_options_search_page = True
 
 # ----- Output options ----------------------
 
@@ -2,7 +2,14 @@
 # This file is maintained at https://github.com/jhauschild/sphinx_cfg_options
 
 import re
-from collections import namedtuple
+import os
+import sys
+import json
+import sqlite3
+from collections import namedtuple, Counter
+from collections.abc import Mapping
+from difflib import get_close_matches
+from fnmatch import fnmatchcase
 
 import docutils
 from docutils import nodes
@@ -25,13 +32,14 @@ from sphinx.util import logging
 logger = logging.getLogger(__name__)
 
 # ConfigEntry is used in CfgDomain.data['config']
+# For entries imported from a cfg inventory, `docname` is None and `anchor` the full URI.
 ConfigEntry = namedtuple(
     'ConfigEntry', "fullname, dispname, docname, anchor, master, nolist, includes, source, line")
 
-# OptionEntry is used in CfgDomain.data['config2options']
+# OptionEntry is used in CfgDomain.data['config2options'], same conventions as ConfigEntry
 OptionEntry = namedtuple(
     'OptionEntry', "fullname, dispname, config, docname, anchor, context, "
-    "default, summary, summarycropped, source, line")
+    "default, summary, summarycropped, source, line, typ")
 
 # ObjectsEntry is returned by Domain.get_objects()
 ObjectsEntry = namedtuple('ObjectsEntry', "name, dispname, typ, docname, anchor, prio")
@@ -39,20 +47,132 @@ ObjectsEntry = namedtuple('ObjectsEntry', "name, dispname, typ, docname, anchor,
 # IndexEntry is retured by Index.generate()
 IndexEntry = namedtuple('IndexEntry', "name, subtype, docname, anchor, extra, qualifier, descr")
 
+# Diagnostic is collected by the ConsistencyChecker, and used in CfgDomain.data['problems']
+# `locations` is a list of (source, line) tuples
+Diagnostic = namedtuple('Diagnostic', "check, level, subject, message, locations")
+
+# SchemaOption is returned by load_schema()
+SchemaOption = namedtuple('SchemaOption', "name, type, default, description, line")
+
+# config name used for options defined outside of any config
+UNKNOWN_CONFIG = "UNKNOWN"
+
 option_header_re = re.compile(r"([\w.]+)\s*(?::\s*([^=]*))?(?:=\s*(\S+.*)\s*)?$")
 option_header_re_comma_sep = re.compile(
     r"([\w.]+(?:\s*,\s*[\w.]+)*)\s*(?::\s*([^=]*))?(?:=\s*(\S+.*)\s*)?$")
 directive_re = re.compile("^..\s*\w+\s*::")
+glob_chars_re = re.compile(r"[*?[]")
+
+
+class NameTrie:
+    """Prefix tree of (config) names, to find all names matching a glob pattern.
+
+    Only the names below the literal prefix of a pattern (i.e. up to the first ``*?[``)
+    need to be checked with :func:`fnmatch.fnmatchcase`.
+    """
+    def __init__(self, names=()):
+        self.root = {}
+        for name in names:
+            self.add(name)
+
+    def add(self, name):
+        node = self.root
+        for char in name:
+            node = node.setdefault(char, {})
+        node[None] = name  # the key `None` marks the end of a name
+
+    def startswith(self, prefix):
+        """List of all names starting with `prefix`."""
+        node = self.root
+        for char in prefix:
+            node = node.get(char, None)
+            if node is None:
+                return []
+        names = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for char, child in node.items():
+                if char is None:
+                    names.append(child)
+                else:
+                    stack.append(child)
+        return names
+
+    def match(self, pattern):
+        """Sorted list of all names matching the glob `pattern`."""
+        m = glob_chars_re.search(pattern)
+        if m is None:
+            return [pattern] if pattern in self else []
+        names = self.startswith(pattern[:m.start()])
+        return sorted([name for name in names if fnmatchcase(name, pattern)])
+
+    def __contains__(self, name):
+        node = self.root
+        for char in name:
+            node = node.get(char, None)
+            if node is None:
+                return False
+        return None in node
+
+
+def is_glob_pattern(name):
+    return glob_chars_re.search(name) is not None
+
+
+class SimilarityIndex:
+    """Trigram index to find the names most similar to a (misspelled) name.
+
+    Candidates are collected from the posting lists of the rarest trigrams of the queried name,
+    and only the best candidates are compared with :func:`difflib.get_close_matches`.
+    """
+    n = 3
+    max_postings = 20000  # upper bound for the number of postings scanned per query
+    max_candidates = 50
+
+    def __init__(self, names):
+        self.names = sorted(set(names))
+        self.postings = {}  # trigram -> list of indices into self.names
+        for i, name in enumerate(self.names):
+            for gram in self.ngrams(name):
+                self.postings.setdefault(gram, []).append(i)
+        self._cache = {}
+
+    def ngrams(self, name):
+        name = "$" + name.lower() + "$"
+        return set(name[i:i + self.n] for i in range(max(len(name) - self.n + 1, 1)))
+
+    def suggest(self, name, num=3, cutoff=0.6):
+        """List of up to `num` names similar to `name`, best match first."""
+        key = (name, num, cutoff)
+        if key not in self._cache:
+            self._cache[key] = self._suggest(name, num, cutoff)
+        return self._cache[key]
+
+    def _suggest(self, name, num, cutoff):
+        postings = [self.postings[gram] for gram in self.ngrams(name) if gram in self.postings]
+        postings.sort(key=len)
+        counts = Counter()
+        scanned = 0
+        for posting in postings:
+            if scanned > 0 and scanned + len(posting) > self.max_postings:
+                break  # the remaining trigrams are too common to be worth it
+            counts.update(posting)
+            scanned += len(posting)
+        candidates = [self.names[i] for i, _ in counts.most_common(self.max_candidates)]
+        return get_close_matches(name, candidates, num, cutoff)
 
 
 class cfgconfig(nodes.General, nodes.Element):
     """A node to be replaced by a list of options for a given `config`.
 
-    The replacement happens in :meth:`ConfigNodeProcessor.process`."""
-    def __init__(self, config, context):
+    The replacement happens in :meth:`ConfigNodeProcessor.process`.
+    `anchor` is the id of the `config` directive containing the node, or None if not indexed."""
+    def __init__(self, config, context, anchor=None):
         super().__init__('')
         self.config = config
         self.context = context
+        self.anchor = anchor
 
 
 class CfgConfig(ObjectDescription):
@@ -82,11 +202,7 @@ class CfgConfig(ObjectDescription):
         signode['ids'].append(node_id)
         self.state.document.note_explicit_target(signode)
 
-        includes = [fullname]  # a config always includes itself
-        for incl in self.options.get('include', "").split(','):
-            incl = incl.strip()
-            if incl and incl not in includes:
-                includes.append(incl)
+        includes = _parse_includes(fullname, self.options.get('include', ""))
         master = 'master' in self.options
         source, line = self.state_machine.get_source_and_line()
         config_entry = ConfigEntry(fullname=fullname,
@@ -99,6 +215,7 @@ class CfgConfig(ObjectDescription):
                                    source=source,
                                    line=line)
         self.env.domaindata['cfg']['config'].append(config_entry)
+        self.config_anchor = node_id
 
     def before_content(self):
         if self.config.cfg_options_parse_numpydoc_style_options and 'noparse' not in self.options:
@@ -114,17 +231,10 @@ class CfgConfig(ObjectDescription):
     def transform_content(self, contentnode):
         config = self.env.ref_context['cfg:config']
         if 'nolist' not in self.options:
-            contentnode.insert(0, cfgconfig(config, self.env.ref_context['cfg:context']))
+            contentnode.insert(0, cfgconfig(config, self.env.ref_context['cfg:context'],
+                                            getattr(self, 'config_anchor', None)))
         else:
-            par = nodes.paragraph('')
-            par += nodes.Text("See ")
-            par += addnodes.pending_xref(config,
-                                         nodes.Text(config),
-                                         refdomain='cfg',
-                                         reftype='config',
-                                         reftarget=config)
-            par += nodes.Text(" for a list of further options.")
-            contentnode.insert(0, par)
+            contentnode.insert(0, _make_see_config_paragraph(config))
         super().transform_content(contentnode)
 
     def after_content(self):
@@ -143,26 +253,19 @@ class CfgConfig(ObjectDescription):
     def parse_numpydoc_style_options(self):
         self.env.app.emit('cfg_options-parse_config', self)
         self.content.disconnect()  # avoid screwing up the parsing of the parent
-        N = len(self.content)
         comma_sep = self.config.cfg_options_parse_comma_sep_names
         if comma_sep:
             header_re = option_header_re_comma_sep
         else:
             header_re = option_header_re
-        # i = index in the lines
         indents = [_get_indent(line) for line in self.content]
-        field_begin = [i for i, indent in enumerate(indents) if indent == 0]
-        for field_beg, field_end in reversed(list(zip(field_begin, field_begin[1:] + [N]))):
+        for field_beg, field_end, m in reversed(_find_option_fields(self.content, header_re)):
             field_beg_line = self.content[field_beg]
-            if directive_re.match(field_beg_line):
-                continue  # ignore other directives
-            m = header_re.match(field_beg_line)
             if m is None:
                 source, line = self.content.info(field_beg)
-                location = "{0!s}:{1!s}".format(source, line)
-                logger.warning("can't parse config option header-line %s",
-                               repr(field_beg_line),
-                               location=location)
+                _note_problem(self.env, 'unparsable-header', field_beg_line,
+                              "can't parse config option header-line %r" % field_beg_line,
+                              source, line)
                 continue
             next_indent = "    "  # default indent, if no non-empty lines follow
             for j in range(field_beg + 1, field_end):
@@ -193,6 +296,71 @@ class CfgConfig(ObjectDescription):
             self.content[field_beg:field_beg + 1] = field_beg_view
 
 
+def _note_problem(env, check, subject, message, source, line):
+    """Record a problem found while reading; reported by the :class:`ConsistencyChecker`."""
+    diagnostic = Diagnostic(check, 'warning', subject, message, [(source, line)])
+    env.domaindata['cfg']['problems'].setdefault(env.docname, []).append(diagnostic)
+
+
+def _make_see_config_paragraph(config):
+    par = nodes.paragraph('')
+    par += nodes.Text("See ")
+    par += addnodes.pending_xref(config,
+                                 nodes.Text(config),
+                                 refdomain='cfg',
+                                 reftype='config',
+                                 reftarget=config)
+    par += nodes.Text(" for a list of further options.")
+    return par
+
+
+def _make_refnode(builder, fromdocname, docname, anchor, contnode, title=None):
+    """Like :func:`sphinx.util.nodes.make_refnode`, but also for entries from inventories."""
+    if docname is None:  # imported from a cfg inventory: `anchor` is the full URI
+        node = nodes.reference('', '', internal=False, refuri=anchor)
+        if title:
+            node['reftitle'] = title
+        node += contnode
+        return node
+    return make_refnode(builder, fromdocname, docname, anchor, contnode, title)
+
+
+def _parse_includes(fullname, include_option):
+    includes = [fullname]  # a config always includes itself
+    for incl in include_option.split(','):
+        incl = incl.strip()
+        if incl and incl not in includes:
+            includes.append(incl)
+    return includes
+
+
+def _crop_summary(lines):
+    """Return the summary for the summary table and whether it was cropped."""
+    summary = lines[0] if len(lines) > 0 else ""
+    if len(lines) > 1 or len(summary) > 80:
+        return summary[:75], True
+    return summary, False
+
+
+def _find_option_fields(lines, header_re):
+    """Find the options in the (dedented) content `lines` of a ``.. cfg:config``.
+
+    Returns a list of `(field_beg, field_end, match)` with the indices of the lines of each
+    option and the match of `header_re` for the header line; `match` is None if the header line
+    can't be parsed. Other directives in the content are skipped.
+    """
+    N = len(lines)
+    # i = index in the lines
+    field_begin = [i for i, line in enumerate(lines) if _get_indent(line) == 0]
+    fields = []
+    for field_beg, field_end in zip(field_begin, field_begin[1:] + [N]):
+        field_beg_line = lines[field_beg]
+        if directive_re.match(field_beg_line):
+            continue  # ignore other directives
+        fields.append((field_beg, field_end, header_re.match(field_beg_line)))
+    return fields
+
+
 def _get_indent(line):
     for i, c in enumerate(line):
         if not c.isspace():
@@ -249,17 +417,21 @@ class CfgOption(ObjectDescription):
         name = sig
         config = self.options.get('config', self.env.ref_context.get('cfg:config', ""))
         if not config:
-            logger.warning("config option with unknown config", location=signode)
-            config = "UNKNOWN"
+            source, line = self.state_machine.get_source_and_line()
+            _note_problem(self.env, 'option-without-config', sig,
+                          "config option '%s' with unknown config" % sig, source, line)
+            config = UNKNOWN_CONFIG
         fullname = config + '.' + name
 
         signode += addnodes.desc_annotation('option ', 'option ')
         if not self.env.ref_context.get('cfg:in-config', False):
-            signode += addnodes.pending_xref(sig,
-                                             addnodes.desc_addname(config, config),
-                                             refdomain='cfg',
-                                             reftype='config',
-                                             reftarget=config)
+            xref = addnodes.pending_xref(sig,
+                                         addnodes.desc_addname(config, config),
+                                         refdomain='cfg',
+                                         reftype='config',
+                                         reftarget=config)
+            xref['cfg:implicit'] = True  # unknown configs are reported by the ConsistencyChecker
+            signode += xref
             signode += addnodes.desc_addname('', '.')
 
         signode += addnodes.desc_name(sig, '', nodes.Text(sig))
@@ -287,13 +459,7 @@ class CfgOption(ObjectDescription):
         self.state.document.note_explicit_target(signode)
         if 'noindex' not in self.options:
             source, line = self.state_machine.get_source_and_line()
-            summary = self.content[0]
-            if len(self.content) > 1 or len(summary) > 80:
-                summary = summary[:75]
-                cropped = True
-            else:
-                cropped = False
-
+            summary, cropped = _crop_summary(self.content)
             option_entry = OptionEntry(
                 fullname=fullname,
                 dispname=sig,
@@ -306,6 +472,7 @@ class CfgOption(ObjectDescription):
                 summarycropped=cropped,
                 source=source,
                 line=line,
+                typ=self.options.get('type', ""),
             )
             config_entries = self.env.domaindata['cfg']['config2options'].setdefault(config, [])
             config_entries.append(option_entry)
@@ -333,6 +500,229 @@ class CfgCurrentConfig(SphinxDirective):
         return []
 
 
+class CfgConfigFrom(SphinxDirective):
+    """Directive for ``.. cfg:config-from``, loading a config and its options from a schema file.
+
+    The options are directly added to the domain data and documented with a plain
+    definition list, without generating and parsing intermediate rst.
+    See :func:`load_schema` for the supported file formats.
+    """
+
+    has_content = False
+    required_arguments = 1
+    optional_arguments = 0
+    final_argument_whitespace = True
+    option_spec = {
+        'config': directives.unchanged,
+        'noindex': directives.flag,
+        'nolist': directives.flag,
+        'master': directives.flag,
+        'context': directives.unchanged,
+        'include': directives.unchanged,
+    }
+
+    def run(self):
+        rel_filename, filename = self.env.relfn2path(self.arguments[0])
+        self.env.note_dependency(rel_filename)
+        source, line = self.state_machine.get_source_and_line()
+        try:
+            title, schema_options = load_schema(filename)
+        except (OSError, ValueError, ImportError) as e:
+            _note_problem(self.env, 'unloadable-schema', rel_filename,
+                          "can't load config schema %s: %s" % (rel_filename, e), source, line)
+            return []
+        fullname = _config_from_name(self.options.get('config', None), title, filename)
+        context = self.options.get('context', None)
+        noindex = 'noindex' in self.options
+
+        desc = addnodes.desc(domain='cfg', objtype='config', desctype='config', noindex=noindex,
+                             classes=['cfg', 'config'])
+        signode = addnodes.desc_signature(fullname, '')
+        signode += addnodes.desc_annotation('config ', 'config ')
+        signode += addnodes.desc_name(fullname, '', nodes.Text(fullname))
+        desc += signode
+        contentnode = addnodes.desc_content()
+        desc += contentnode
+        summary_node = cfgconfig(fullname, context)
+        if 'nolist' in self.options:
+            contentnode += _make_see_config_paragraph(fullname)
+        elif not noindex:  # otherwise, the options are not registered for the summary
+            contentnode += summary_node
+
+        if not noindex:
+            node_id = make_id(self.env, self.state.document, 'cfg-config', fullname)
+            summary_node.anchor = node_id
+            signode['ids'].append(node_id)
+            self.state.document.note_explicit_target(signode)
+            config_entry = ConfigEntry(fullname=fullname,
+                                       dispname=fullname,
+                                       docname=self.env.docname,
+                                       anchor=node_id,
+                                       master='master' in self.options,
+                                       nolist='nolist' in self.options,
+                                       includes=_parse_includes(fullname,
+                                                                self.options.get('include', "")),
+                                       source=source,
+                                       line=line)
+            self.env.domaindata['cfg']['config'].append(config_entry)
+
+        if schema_options:
+            contentnode += self.make_option_list(fullname, context, schema_options, noindex,
+                                                 filename, source, line)
+        return [desc]
+
+    def make_option_list(self, config, context, schema_options, noindex, filename, source, line):
+        if not noindex:
+            config_entries = self.env.domaindata['cfg']['config2options'].setdefault(config, [])
+        deflist = nodes.definition_list(classes=['cfg-option-list'])
+        for opt in schema_options:
+            term = nodes.term('', '')
+            term += addnodes.literal_strong(opt.name, opt.name)
+            if opt.type:
+                term += nodes.Text(" : " + opt.type)
+            if opt.default:
+                term += nodes.Text(" = ")
+                term += nodes.literal(opt.default, opt.default)
+            definition = nodes.definition()
+            lines = opt.description.splitlines()
+            for par in opt.description.split("\n\n"):
+                if par.strip():
+                    definition += nodes.paragraph(par, par)
+            deflist += nodes.definition_list_item('', term, definition)
+            if noindex:
+                continue
+            fullname = config + '.' + opt.name
+            node_id = make_id(self.env, self.state.document, 'cfg-option', fullname)
+            term['ids'].append(node_id)
+            self.state.document.note_explicit_target(term)
+            summary, cropped = _crop_summary(lines)
+            config_entries.append(OptionEntry(
+                fullname=fullname,
+                dispname=opt.name,
+                config=config,
+                docname=self.env.docname,
+                anchor=node_id,
+                context=context,
+                default=opt.default,
+                summary=summary,
+                summarycropped=cropped,
+                # options from JSON lines know their line in the schema file
+                source=source if opt.line is None else filename,
+                line=line if opt.line is None else opt.line,
+                typ=opt.type,
+            ))
+        return deflist
+
+
+def _config_from_name(config_option, title, filename):
+    """Name of the config of a ``cfg:config-from``: `:config:`, schema title or file basename."""
+    if config_option:
+        return config_option
+    if title:
+        return title
+    return os.path.splitext(os.path.basename(filename))[0]
+
+
+_schema_cache = {}  # filename -> (mtime, size, result of load_schema)
+
+
+def load_schema(filename):
+    """Load the options defined in a schema file.
+
+    Supported formats, chosen by the file extension:
+
+    - ``.json``: a JSON schema with (possibly nested) ``"properties"``, each of which can
+      define a ``"type"``, ``"default"`` and ``"description"``.
+    - ``.yaml``, ``.yml``: the same structure in YAML; requires PyYAML.
+    - ``.jsonl``: JSON lines with one option ``{"name": ..., "type": ..., ...}`` per line,
+      and optionally a line ``{"title": ...}``. The file is read as a stream,
+      which is recommended for huge schemas.
+
+    Results are cached as long as the modification time and size of the file don't change.
+
+    Returns
+    -------
+    title : str
+        The title given in the schema, or an empty string.
+    options : list of :class:`SchemaOption`
+    """
+    stat = os.stat(filename)
+    cached = _schema_cache.get(filename, None)
+    if cached is not None and cached[:2] == (stat.st_mtime, stat.st_size):
+        return cached[2]
+    ext = os.path.splitext(filename)[1].lower()
+    if ext == '.jsonl':
+        result = _load_jsonl_schema(filename)
+    else:
+        with open(filename, encoding='utf-8') as f:
+            if ext in ['.yaml', '.yml']:
+                import yaml
+                schema = yaml.safe_load(f)
+            else:
+                schema = json.load(f)
+        if not isinstance(schema, dict):
+            raise ValueError("expected a mapping at the top level")
+        result = (schema.get('title', ""), list(_iter_schema_properties(schema)))
+    _schema_cache[filename] = (stat.st_mtime, stat.st_size, result)
+    return result
+
+
+def _load_jsonl_schema(filename):
+    title = ""
+    options = []
+    with open(filename, encoding='utf-8') as f:
+        for i, line in enumerate(f):
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if 'name' not in entry:
+                title = entry.get('title', title)
+                continue
+            options.append(_make_schema_option(entry['name'], entry, i + 1))
+    return title, options
+
+
+def _iter_schema_properties(schema, prefix=""):
+    properties = schema.get('properties', None)
+    if properties is None:  # plain mapping name -> property
+        properties = {k: v for k, v in schema.items() if _is_schema_property(k, v)}
+    for name, prop in properties.items():
+        if not isinstance(prop, dict):
+            continue
+        if isinstance(prop.get('properties', None), dict):
+            yield from _iter_schema_properties(prop, prefix + name + '.')
+        else:
+            yield _make_schema_option(prefix + name, prop, None)
+
+
+def _is_schema_property(name, prop):
+    """Whether `prop` in a plain mapping without ``"properties"`` defines an option."""
+    if not isinstance(prop, dict) or name.startswith('$') or name == 'definitions':
+        return False  # e.g. "$defs" or "definitions" with sub-schemas for references
+    if isinstance(prop.get('properties', None), dict):
+        return True
+    return any(key in prop for key in ['type', 'default', 'description', 'title'])
+
+
+def _make_schema_option(name, prop, line):
+    typ = prop.get('type', "")
+    if isinstance(typ, list):
+        typ = ", ".join(typ)
+    default = json.dumps(prop['default']) if 'default' in prop else ""
+    description = prop.get('description', prop.get('title', ""))
+    return SchemaOption(name, typ, default, description, line)
+
+
+class CfgOptionXRefRole(XRefRole):
+    """Role ``:cfg:option:``, recording the current config for relative references."""
+
+    def process_link(self, env, refnode, has_explicit_title, title, target):
+        config = env.ref_context.get('cfg:config', None)
+        if config:
+            refnode['cfg:config'] = config
+        return super().process_link(env, refnode, has_explicit_title, title, target)
+
+
 class ConfigNodeProcessor:
     def __init__(self, app, doctree, docname):
         self.env = app.builder.env
@@ -347,11 +737,18 @@ class ConfigNodeProcessor:
             config = node.config
             context = node.context
             options = self.domain.config_options[config]
+            master = self.domain.master_configs.get(config, None)
+            dedup_threshold = self.builder.config.cfg_options_summary_dedup_threshold
 
             if self.builder.config.cfg_options_summary is None:
                 new_content = []
             elif len(options) == 0:
                 new_content = [nodes.Text("[No options defined for this config]")]
+            elif dedup_threshold is not None and len(options) > int(dedup_threshold) and \
+                    master is not None and not master.nolist and \
+                    (master.docname, master.anchor) != (self.docname, node.anchor):
+                # the full summary is only included at the master
+                new_content = [self.create_master_reference(config, options, master)]
             elif self.builder.config.cfg_options_summary == "table":
                 new_content = self.create_summary_table(config, context, options)
             elif self.builder.config.cfg_options_summary == "list":
@@ -365,6 +762,14 @@ class ConfigNodeProcessor:
                 raise ValueError("unknown value for config option `cfg_options_summary`.")
             node.replace_self(new_content)
 
+    def create_master_reference(self, config, options, master):
+        par = nodes.paragraph()
+        par += nodes.Text("%d options, see " % len(options))
+        innernode = addnodes.literal_strong(config, config)
+        par += self.make_refnode(master.docname, master.anchor, innernode)
+        par += nodes.Text(" for the full list.")
+        return par
+
     def create_summary_table(self, config, context, options):
         default_column = self.builder.config.cfg_options_default_in_summary_table
         table_spec = addnodes.tabular_col_spec()
@@ -431,7 +836,7 @@ class ConfigNodeProcessor:
 
     def make_refnode(self, docname, anchor, innernode):
         try:
-            refnode = make_refnode(self.builder, self.docname, docname, anchor, innernode)
+            refnode = _make_refnode(self.builder, self.docname, docname, anchor, innernode)
         except NoUri:  # ignore if no URI can be determined, e.g. for LaTeX output
             refnode = innernode
         return refnode
@@ -440,26 +845,368 @@ class ConfigNodeProcessor:
         node = nodes.Text(config, config)
         match = [(obj_entry.docname, obj_entry.anchor) for obj_entry in self.domain.get_objects()
                  if obj_entry.name == config and obj_entry.typ == 'config']
+        if len(match) == 0 and config in self.domain.external_configs:
+            match = [(None, self.domain.external_configs[config].anchor)]
         if len(match) > 0:
             docname, anchor = match[0]
             node = self.make_refnode(docname, anchor, node)
         return node
 
 
+class ConsistencyChecker:
+    """Validate the whole catalog of configs and options in a single sweep.
+
+    Connected to the ``env-check-consistency`` event. Each problem is reported only once
+    (with all the locations where it occurs), and if `cfg_options_diagnostics_file` is set,
+    all of them are written to that file in the output directory.
+    """
+    def __init__(self, app, env):
+        self.app = app
+        self.env = env
+        self.domain = env.get_domain('cfg')
+        self.diagnostics = {}  # (check, subject) -> Diagnostic
+
+        self.check()
+        self.report()
+
+    def add(self, check, level, subject, message, source, line):
+        key = (check, subject)
+        diagnostic = self.diagnostics.get(key, None)
+        if diagnostic is None:
+            self.diagnostics[key] = Diagnostic(check, level, subject, message, [(source, line)])
+        elif (source, line) not in diagnostic.locations:
+            diagnostic.locations.append((source, line))
+
+    def check(self):
+        for problems in self.domain.data['problems'].values():
+            for problem in problems:
+                for source, line in problem.locations:
+                    self.add(problem.check, problem.level, problem.subject, problem.message,
+                             source, line)
+        self.check_masters()
+        self.check_includes()
+        self.check_include_cycles()
+        self.check_unknown_configs()
+        self.check_conflicting_defaults()
+        self.check_shadowed_options()
+
+    def check_masters(self):
+        masters = {}
+        for config_entry in self.domain.data['config']:
+            if config_entry.master:
+                masters.setdefault(config_entry.fullname, []).append(config_entry)
+        for name, entries in masters.items():
+            if len(entries) > 1:
+                for config_entry in entries:
+                    self.add('duplicate-master', 'warning', name,
+                             "multiple 'cfg:config' objects %s with ':master:'" % name,
+                             config_entry.source, config_entry.line)
+
+    def check_includes(self):
+        trie = self.domain.config_trie
+        for config_entry in self.domain.data['config']:
+            for incl in config_entry.includes:
+                if is_glob_pattern(incl):
+                    if not trie.match(incl):
+                        self.add('unknown-include', 'warning', (config_entry.fullname, incl),
+                                 "include pattern '%s' of config '%s' matches no config" %
+                                 (incl, config_entry.fullname),
+                                 config_entry.source, config_entry.line)
+                elif incl not in trie:
+                    self.add('unknown-include', 'warning', (config_entry.fullname, incl),
+                             "config '%s' includes unknown (not indexed) config '%s'" %
+                             (config_entry.fullname, incl), config_entry.source, config_entry.line)
+        for incl in self.env.config.cfg_options_always_include:
+            if is_glob_pattern(incl):
+                if not trie.match(incl):
+                    self.add('unknown-include', 'warning', ('cfg_options_always_include', incl),
+                             "pattern '%s' in `cfg_options_always_include` matches no config" %
+                             incl, "conf.py", 0)
+            elif incl not in trie:
+                self.add('unknown-include', 'warning', ('cfg_options_always_include', incl),
+                         "`cfg_options_always_include` contains unknown (not indexed) config "
+                         "'%s'" % incl, "conf.py", 0)
+
+    def check_include_cycles(self):
+        self.domain.config_trie  # make sure the trie for expanding glob patterns exists
+        graph = {}
+        for config_entry in self.domain.data['config']:
+            includes = graph.setdefault(config_entry.fullname, [])
+            for incl in self.domain._expand_includes(config_entry.includes):
+                if incl != config_entry.fullname and incl not in includes:
+                    includes.append(incl)
+        for cycle in _strongly_connected_components(graph):
+            if len(cycle) < 2:
+                continue
+            cycle = sorted(cycle)
+            for config_entry in self.domain.data['config']:
+                if config_entry.fullname in cycle:
+                    self.add('include-cycle', 'warning', tuple(cycle),
+                             "cyclic includes between the configs %s" % ', '.join(cycle),
+                             config_entry.source, config_entry.line)
+
+    def check_unknown_configs(self):
+        master_configs = self.domain.master_configs
+        for config, options in self.domain.data['config2options'].items():
+            if config in master_configs or config == UNKNOWN_CONFIG:
+                continue
+            for option in options:
+                self.add('unknown-config', 'warning', config,
+                         "`cfg:option` entries belong to a non-indexed, unknown config %s"
+                         " (-> Typo?)" % config, option.source, option.line)
+
+    def check_conflicting_defaults(self):
+        for config, options in self.domain.data['config2options'].items():
+            defaults = {}
+            for option in options:
+                if option.default:
+                    defaults.setdefault(option.dispname, {}).setdefault(option.default, option)
+            for name, by_default in defaults.items():
+                if len(by_default) < 2:
+                    continue
+                fullname = config + '.' + name
+                message = "conflicting default values %s for option %s" % (
+                    ', '.join(sorted(by_default.keys())), fullname)
+                for option in by_default.values():
+                    self.add('conflicting-default', 'warning', fullname, message,
+                             option.source, option.line)
+
+    def check_shadowed_options(self):
+        if not self.env.config.cfg_options_unique:
+            return
+        shadowed = {}  # (fullname, shadowed fullname) -> (option, shadowed option, configs)
+        for config, options in self.domain.all_config_options.items():
+            last = None
+            for option in options:
+                if last is not None and option.dispname == last.dispname and \
+                        option.config != last.config:
+                    key = (last.fullname, option.fullname)
+                    shadowed.setdefault(key, (last, option, set()))[2].add(config)
+                else:
+                    last = option
+        for key, (option, other, configs) in shadowed.items():
+            message = "option %s shadows %s" % key
+            if option.default != other.default:
+                message += " (default %r instead of %r)" % (option.default, other.default)
+            message += " in config%s %s" % ("s" if len(configs) > 1 else "",
+                                            ", ".join(sorted(configs)))
+            self.add('shadowed-option', 'info', key, message, option.source, option.line)
+
+    def report(self):
+        diagnostics = sorted(self.diagnostics.values(), key=lambda d: (d.check, str(d.subject)))
+        for diagnostic in diagnostics:
+            source, line = diagnostic.locations[0]
+            message = diagnostic.message
+            if len(diagnostic.locations) > 1:
+                message += "; also at " + ", ".join(
+                    "%s:%s" % location for location in diagnostic.locations[1:])
+            location = "{0!s}:{1!s}".format(source, line)
+            if diagnostic.level == 'warning':
+                logger.warning(message, location=location, type='cfg', subtype=diagnostic.check)
+            else:
+                logger.info(message, location=location)
+
+        filename = self.env.config.cfg_options_diagnostics_file
+        if filename:
+            data = {
+                'version': 1,
+                'diagnostics': [{
+                    'check': d.check,
+                    'level': d.level,
+                    'subject': d.subject,
+                    'message': d.message,
+                    'locations': [{'source': source, 'line': line}
+                                  for source, line in d.locations],
+                } for d in diagnostics],
+            }
+            with open(os.path.join(self.app.outdir, filename), 'w') as f:
+                json.dump(data, f, indent=1)
+
+
+def _unique_options(options):
+    """Keep only the first of the sorted `options` with the same name."""
+    new_options = []
+    last = ""
+    for option in options:
+        if option.dispname != last:
+            new_options.append(option)
+        last = option.dispname
+    return new_options
+
+
+class CatalogDB:
+    """SQLite database with the configs, options and resolved includes of the catalog.
+
+    Written to `cfg_options_catalog_db` in the doctree directory, such that the (possibly huge)
+    lists of options for each config don't need to be kept in memory, but are queried on demand.
+    The file can also be queried directly, e.g. with the ``sqlite3`` command line tool.
+    """
+    schema = """
+        CREATE TABLE configs (name TEXT PRIMARY KEY, dispname TEXT, docname TEXT, anchor TEXT,
+                              master INTEGER, nolist INTEGER, source TEXT, line INTEGER);
+        CREATE TABLE includes (config TEXT, include TEXT, prio INTEGER);
+        CREATE TABLE options (fullname TEXT, dispname TEXT, config TEXT, docname TEXT,
+                              anchor TEXT, context TEXT, default_ TEXT, summary TEXT,
+                              summarycropped INTEGER, source TEXT, line INTEGER, typ TEXT);
+    """
+    indices = """
+        CREATE INDEX includes_config ON includes (config, prio);
+        CREATE INDEX options_config ON options (config, dispname);
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._connection = None
+        self._pid = None
+
+    @property
+    def connection(self):
+        if self._connection is None or self._pid != os.getpid():  # don't share across forks
+            self._connection = sqlite3.connect(self.filename)
+            self._connection.create_function('pylower', 1, str.lower, deterministic=True)
+            self._pid = os.getpid()
+        return self._connection
+
+    def write(self, master_configs, config2options):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+        con = self.connection
+        con.executescript(self.schema)
+        con.executemany("INSERT INTO configs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        ((c.fullname, c.dispname, c.docname, c.anchor, c.master, c.nolist,
+                          c.source, c.line) for c in master_configs.values()))
+        includes = []
+        for config, config_entry in master_configs.items():
+            includes.extend((config, incl, i) for i, incl in enumerate(config_entry.includes))
+        for config in config2options:
+            if config not in master_configs:  # not indexed, but defines options
+                includes.append((config, config, 0))
+        con.executemany("INSERT INTO includes VALUES (?, ?, ?)", includes)
+        con.executemany("INSERT INTO options VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (tuple(option) for options in config2options.values()
+                         for option in options))
+        con.executescript(self.indices)
+        con.commit()
+
+    def config_names(self):
+        return [row[0] for row in self.connection.execute("SELECT DISTINCT config FROM includes")]
+
+    def has_config(self, config):
+        query = "SELECT 1 FROM includes WHERE config = ? LIMIT 1"
+        return self.connection.execute(query, (config, )).fetchone() is not None
+
+    def options(self, config):
+        """List of OptionEntry for `config` and its includes, sorted like `all_config_options`."""
+        query = ("SELECT o.* FROM includes i JOIN options o ON o.config = i.include "
+                 "WHERE i.config = ? ORDER BY pylower(o.dispname), i.prio, o.rowid")
+        return [self._option_entry(row) for row in self.connection.execute(query, (config, ))]
+
+    def find_option(self, config, name):
+        """The OptionEntry `name` of `config` or its includes with the highest priority."""
+        query = ("SELECT o.* FROM includes i JOIN options o ON o.config = i.include "
+                 "WHERE i.config = ? AND o.dispname = ? ORDER BY i.prio, o.rowid LIMIT 1")
+        row = self.connection.execute(query, (config, name)).fetchone()
+        return None if row is None else self._option_entry(row)
+
+    @staticmethod
+    def _option_entry(row):
+        option = OptionEntry(*row)
+        return option._replace(summarycropped=bool(option.summarycropped))
+
+
+class CatalogOptionsView(Mapping):
+    """Read-only dict config_name -> List[OptionEntry], querying a :class:`CatalogDB`."""
+    def __init__(self, db, unique):
+        self.db = db
+        self.unique = unique
+
+    def __getitem__(self, config):
+        options = self.db.options(config)
+        if not options and not self.db.has_config(config):
+            raise KeyError(config)
+        if self.unique:
+            options = _unique_options(options)
+        return options
+
+    def __contains__(self, config):
+        return self.db.has_config(config)
+
+    def __iter__(self):
+        return iter(self.db.config_names())
+
+    def __len__(self):
+        return len(self.db.config_names())
+
+
+def _strongly_connected_components(graph):
+    """Tarjan's algorithm (iterative) for a dict node -> list of successor nodes."""
+    index = {}
+    lowlink = {}
+    stack = []
+    on_stack = set()
+    result = []
+    for root in graph:
+        if root in index:
+            continue
+        work = [(root, iter(graph.get(root, [])))]
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, successors = work[-1]
+            for succ in successors:
+                if succ not in index:
+                    index[succ] = lowlink[succ] = len(index)
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(graph.get(succ, []))))
+                    break
+                elif succ in on_stack:
+                    lowlink[node] = min(lowlink[node], index[succ])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    result.append(component)
+    return result
+
+
 class CfgOptionIndex(Index):
     name = 'option'
     localname = 'Config Option Index'
     shortname = 'Config Option'
 
     def generate(self, docnames=None):
-        config_options = self.domain.all_config_options.copy()
-        content = []
-        dummy_option = OptionEntry(*([""] * 11))
+        return (_generate_index_content(self), True)
+
+    def iter_groups(self):
+        """Yield the `(config, entries)` groups of the index one by one."""
+        config_options = self.domain.all_config_options
+        master_configs = self.domain.master_configs
+        dummy_option = OptionEntry(*([""] * 12))
         for k in sorted(config_options.keys(), key=lambda x: x.upper()):
+            master = master_configs.get(k, None)
+            if master is not None and master.docname is None:
+                continue  # config imported from a cfg inventory
             options = config_options[k]
             if len(options) == 0:
-                content.append((k, []))
+                yield (k, [])
                 continue
+            options = [opt for opt in options if opt.docname is not None]  # skip inventories
+            if len(options) == 0:
+                continue  # only imported options
             index_list = []
             last_name = ""
             for opt, next_opt in zip(options, options[1:] + [dummy_option]):
@@ -481,8 +1228,7 @@ class CfgOptionIndex(Index):
                                        descr=opt.config)
                 index_list.append(ind_entry)
                 last_name = name
-            content.append((k, index_list))
-        return (content, True)
+            yield (k, index_list)
 
 
 class CfgConfigIndex(Index):
@@ -491,13 +1237,26 @@ class CfgConfigIndex(Index):
     shortname = 'Config Index'
 
     def generate(self, docnames=None):
+        return (_generate_index_content(self), True)
+
+    def iter_groups(self):
+        """Yield the `(letter, entries)` groups of the index one by one."""
         master_configs = self.domain.master_configs
-        data_configs = self.domain.data['config']
-        content = {}
+        data_configs = {}
+        for config in self.domain.data['config']:
+            data_configs.setdefault(config.fullname, []).append(config)
+        letter = None
+        index_list = []
         for key in sorted(master_configs.keys(), key=lambda k: k.upper()):
-            index_list = content.setdefault(key[0].upper(), [])
-            data = [config for config in data_configs if config.fullname == key]
             master = master_configs[key]
+            if master.docname is None:
+                continue  # imported from a cfg inventory
+            if key[0].upper() != letter:
+                if index_list:
+                    yield (letter, index_list)
+                letter = key[0].upper()
+                index_list = []
+            data = data_configs.get(key, [])
             if len(data) > 1:
                 index_list.append(
                     IndexEntry(master.dispname, 1, master.docname, master.anchor, "master",
@@ -510,9 +1269,121 @@ class CfgConfigIndex(Index):
                 index_list.append(
                     IndexEntry(master.dispname, 0, master.docname, master.anchor, "", "includes",
                                ', '.join(master.includes)))
+        if index_list:
+            yield (letter, index_list)
 
-        res = [(k, content[k]) for k in sorted(content.keys())]
-        return (res, True)
+
+def _generate_index_content(index):
+    """Content for `index.generate()`.
+
+    If `cfg_options_index_pages` is set, the content is only an overview linking to the pages
+    generated by :func:`collect_index_pages`.
+    """
+    pages = index.domain.env.config.cfg_options_index_pages
+    if not pages:
+        return list(index.iter_groups())
+    content = []
+    labels = []
+    for pagename, label, groups in _iter_index_shards(index, pages):
+        labels.append((pagename, label))
+        n_entries = sum(len(entries) for _, entries in groups)
+        name = groups[0][0] if len(groups) == 1 else "%s ... %s" % (groups[0][0], groups[-1][0])
+        content.append((label, [IndexEntry(name, 0, pagename, "", "", "",
+                                           "%d entries" % n_entries)]))
+    # remember the labels for `collect_index_pages`, which runs after writing the indices
+    index.domain.index_page_labels[index.name] = labels
+    return content
+
+
+def _iter_index_shards(index, pages):
+    """Split the groups of an index into shards of either one letter or `pages` entries.
+
+    Yields `(pagename, label, groups)`; only the groups of a single shard are kept in memory.
+    With a fixed number of entries, shards are cut between groups where possible; groups with
+    more entries are split and continue on the next page under the same heading.
+    """
+    prefix = index.domain.name + '-' + index.name + '-'
+    if pages != 'letter':
+        pages = int(pages)  # might be a string if given with ``sphinx-build -D``
+    shard = []
+    label = None
+    size = 0
+    n_shards = 0
+    for key, entries in index.iter_groups():
+        if pages == 'letter':
+            letter = key[:1].upper()
+            if shard and letter != label:
+                yield (prefix + label, label, shard)
+                shard = []
+            label = letter
+            shard.append((key, entries))
+            continue
+        if shard and size + len(entries) > pages and len(entries) <= pages:
+            yield (prefix + label, label, shard)
+            shard = []
+        parent = None  # the last entry with sub-entries
+        while entries:
+            if shard and size >= pages:
+                yield (prefix + label, label, shard)
+                shard = []
+            min_size = 1
+            if not shard:
+                size = 0
+                n_shards += 1
+                label = str(n_shards)
+                if parent is not None and entries[0].subtype == 2:
+                    entries = [parent] + entries  # repeat the parent of the sub-entries
+                    min_size = 2
+            part = entries[:max(pages - size, min_size)]
+            entries = entries[len(part):]
+            for entry in part:
+                if entry.subtype == 1:
+                    parent = entry
+            shard.append((key, part))
+            size += len(part)
+    if shard:
+        yield (prefix + label, label, shard)
+
+
+def collect_index_pages(app):
+    """Generate the separate pages of the indices, if `cfg_options_index_pages` is set.
+
+    Connected to the ``html-collect-pages`` event. The pages use the ``domainindex.html``
+    template; the navigation to the overview and the previous/next page of the index is
+    given as `rellinks`, `prev` and `next` in the context.
+    """
+    pages = app.config.cfg_options_index_pages
+    if not pages:
+        return
+    builder = app.builder
+    domain = app.env.get_domain('cfg')
+    for index_cls in [CfgConfigIndex, CfgOptionIndex]:
+        index = index_cls(domain)
+        overview = domain.name + '-' + index.name
+        labels = domain.index_page_labels.get(index.name)
+        if labels is None:  # index not written by the builder
+            labels = [(pagename, label)
+                      for pagename, label, _ in _iter_index_shards(index, pages)]
+        shards = _iter_index_shards(index, pages)
+        for i, (pagename, label, groups) in enumerate(shards):
+            rellinks = [(overview, index.localname, '', 'all')]
+            context = {
+                'indextitle': "%s: %s" % (index.localname, label),
+                'content': groups,
+                'collapse_index': False,
+            }
+            if i + 1 < len(labels):
+                other, other_label = labels[i + 1]
+                context['next'] = {'link': builder.get_relative_uri(pagename, other),
+                                   'title': other_label}
+                rellinks.append((other, other_label, 'N', 'next'))
+            if i > 0:
+                other, other_label = labels[i - 1]
+                context['prev'] = {'link': builder.get_relative_uri(pagename, other),
+                                   'title': other_label}
+                rellinks.append((other, other_label, 'P', 'previous'))
+            context['rellinks'] = rellinks + builder.globalcontext['rellinks']
+            yield (pagename, context, 'domainindex.html')
 
 
 class CfgDomain(Domain):
@@ -526,12 +1397,13 @@ class CfgDomain(Domain):
 
     roles = {
         'config': XRefRole(),
-        'option': XRefRole(),
+        'option': CfgOptionXRefRole(),
     }
 
     directives = {
         'config': CfgConfig,
         'configoptions': CfgConfigOptions,
+        'config-from': CfgConfigFrom,
         'currentconfig': CfgCurrentConfig,
         'option': CfgOption,
     }
@@ -544,10 +1416,14 @@ class CfgDomain(Domain):
     initial_data = {
         'config': [],  # ConfigEntry
         'config2options': {},  # config_name -> List[OptionEntry]
+        'problems': {},  # docname -> List[Diagnostic], problems found while reading
+        'inventories': {},  # filename -> mtime of the imported cfg inventories
     }
+    data_version = 3
 
     def clear_doc(self, docname):
         self.data['config'] = [entry for entry in self.data['config'] if entry.docname != docname]
+        self.data['problems'].pop(docname, None)
         for config_name, entries_list in self.data['config2options'].items():
             filered_entries = [entry for entry in entries_list if entry.docname != docname]
             self.data['config2options'][config_name] = filered_entries
@@ -560,14 +1436,16 @@ class CfgDomain(Domain):
                                config_entry.docname,
                                config_entry.anchor,
                                prio=0 if config_entry.master else 1)
+        # with the dedicated search page, keep options out of the general search index
+        option_prio = -1 if self.env.config.cfg_options_search_page else 1
         for option_list in self.data['config2options'].values():
             for option_entry in option_list:
                 yield ObjectsEntry(option_entry.fullname,
                                    option_entry.dispname,
-                                   'config',
+                                   'option',
                                    option_entry.docname,
                                    option_entry.anchor,
-                                   prio=1)
+                                   prio=option_prio)
 
     def resolve_xref(self, env, fromdocname, builder, typ, target, node, contnode):
         if not target:
@@ -576,22 +1454,35 @@ class CfgDomain(Domain):
             config = self.master_configs.get(target, None)
             if config is None:
                 return None
-            return make_refnode(builder, fromdocname, config.docname, config.anchor, contnode,
-                                config.dispname)
+            return _make_refnode(builder, fromdocname, config.docname, config.anchor, contnode,
+                                 config.dispname)
         elif typ == "option":
-            config_options = self.config_options
+            candidates = []
+            context_config = node.get('cfg:config', None)
+            if context_config:
+                candidates.append((context_config, target))
             split = target.split('.')
-            if len(split) < 2:
-                return None
             for i in range(1, len(split)):
-                config, entry_name = '.'.join(split[:i]), '.'.join(split[i:])
-                for option_entry in config_options.get(config, []):
-                    if option_entry.dispname == entry_name:  # match!
-                        return make_refnode(builder, fromdocname, option_entry.docname,
-                                            option_entry.anchor, contnode, option_entry.dispname)
+                candidates.append(('.'.join(split[:i]), '.'.join(split[i:])))
+            for config, entry_name in candidates:
+                option_entry = self.find_option(config, entry_name)
+                if option_entry is not None:  # match!
+                    return _make_refnode(builder, fromdocname, option_entry.docname,
+                                         option_entry.anchor, contnode, option_entry.dispname)
             return None
         return None
 
+    def find_option(self, config, name):
+        """The OptionEntry `name` of `config` (including its `includes`), or None."""
+        if self.env.config.cfg_options_catalog_db:
+            return self.catalog_db.find_option(config, name)
+        if not hasattr(self, '_option_lookup'):
+            self._option_lookup = lookup = {}  # (config_name, option_name) -> OptionEntry
+            for config_name, options in self.config_options.items():
+                for option_entry in options:
+                    lookup.setdefault((config_name, option_entry.dispname), option_entry)
+        return self._option_lookup.get((config, name), None)
+
     @property
     def master_configs(self):
         """dict config_name -> ConfigEntry, with recursive `includes`."""
@@ -604,15 +1495,114 @@ class CfgDomain(Domain):
         """dict config_name -> List[OptionEntry], taking into account recursive `includes`.
 
         If `cfg_options_unique` is True, the list is filtered to include each option name only
-        once.
+        once. With `cfg_options_catalog_db`, this is a :class:`CatalogOptionsView`.
         """
+        if self.env.config.cfg_options_catalog_db:
+            return CatalogOptionsView(self.catalog_db, self.env.config.cfg_options_unique)
         if not hasattr(self, '_config_options'):
             self._build_config_options()
         return self._config_options
 
+    @property
+    def catalog_db(self):
+        """:class:`CatalogDB` with the resolved catalog, written when first accessed."""
+        if not hasattr(self, '_catalog_db'):
+            filename = os.path.join(self.env.doctreedir, self.env.config.cfg_options_catalog_db)
+            self._catalog_db = CatalogDB(filename)
+            self._catalog_db.write(self.master_configs, self._merged_config2options())
+        return self._catalog_db
+
+    @property
+    def config_trie(self):
+        """:class:`NameTrie` of all indexed config names."""
+        if not hasattr(self, '_config_trie'):
+            self._build_master_configs()
+        return self._config_trie
+
+    @property
+    def external_configs(self):
+        """dict config_name -> ConfigEntry, imported from `cfg_options_inventories`."""
+        if not hasattr(self, '_external_configs'):
+            self._load_inventories()
+        return self._external_configs
+
+    @property
+    def external_config2options(self):
+        """dict config_name -> List[OptionEntry], imported from `cfg_options_inventories`."""
+        if not hasattr(self, '_external_config2options'):
+            self._load_inventories()
+        return self._external_config2options
+
+    def _load_inventories(self):
+        self._external_configs = configs = {}
+        self._external_config2options = config2options = {}
+        for name, (base_uri, filename) in self.env.config.cfg_options_inventories.items():
+            filename = os.path.join(self.env.app.confdir, filename)
+            try:
+                inventory = load_inventory(filename)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning("failed to load cfg inventory %r from %s: %s", name, filename, e,
+                               type='cfg', subtype='inventory')
+                continue
+            if base_uri and not base_uri.endswith('/'):
+                base_uri += '/'
+            for config, (uri, includes) in inventory['configs'].items():
+                if config in configs:
+                    continue  # first inventory wins
+                configs[config] = ConfigEntry(fullname=config,
+                                              dispname=config,
+                                              docname=None,
+                                              anchor=base_uri + uri,
+                                              master=False,
+                                              nolist=False,
+                                              includes=[config] + includes,
+                                              source=filename,
+                                              line=0)
+            for config, options in inventory['options'].items():
+                option_entries = config2options.setdefault(config, [])
+                for optname, uri, context, default, summary, cropped, typ in options:
+                    option_entries.append(OptionEntry(fullname=config + '.' + optname,
+                                                      dispname=optname,
+                                                      config=config,
+                                                      docname=None,
+                                                      anchor=base_uri + uri,
+                                                      context=context,
+                                                      default=default,
+                                                      summary=summary,
+                                                      summarycropped=cropped,
+                                                      source=filename,
+                                                      line=0,
+                                                      typ=typ))
+
+    def similarity_index(self, typ):
+        """:class:`SimilarityIndex` of the config or option names which can be referenced."""
+        if not hasattr(self, '_similarity_indices'):
+            self._similarity_indices = {}
+        if typ not in self._similarity_indices:
+            if typ == "config":
+                names = self.master_configs.keys()
+            else:  # all names resolved by `find_option`, including `includes` and inventories
+                names = [config + '.' + option.dispname
+                         for config, options in self.config_options.items()
+                         for option in options]
+            self._similarity_indices[typ] = SimilarityIndex(names)
+        return self._similarity_indices[typ]
+
+    @property
+    def index_page_labels(self):
+        """``{index.name: [(pagename, label), ...]}`` of the pages of the indices.
+
+        Filled by :func:`_generate_index_content` if `cfg_options_index_pages` is set.
+        """
+        if not hasattr(self, '_index_page_labels'):
+            self._index_page_labels = {}
+        return self._index_page_labels
+
     @property
     def all_config_options(self):
-        """same as `config_options`"""
+        """same as `config_options`, but never filtered by `cfg_options_unique`"""
+        if self.env.config.cfg_options_catalog_db:
+            return CatalogOptionsView(self.catalog_db, False)
         if not hasattr(self, '_all_config_options'):
             self._build_config_options()
         return self._all_config_options
@@ -624,12 +1614,6 @@ class CfgDomain(Domain):
         # collect master configs
         for config_entry in data_config:
             if config_entry.master:
-                other = master_configs.get(config_entry.fullname, None)
-                if other:
-                    logger.warning(
-                        "two 'cfg:config' objects %s with ':master:' "
-                        "in %s, line %d and %s, line %d", config_entry.fullname,
-                        config_entry.source, config_entry.line, other.source, other.line)
                 master_configs[config_entry.fullname] = config_entry
         # if no master is given: master = first defined entry without :nolist: option
         for config_entry in data_config:
@@ -638,18 +1622,30 @@ class CfgDomain(Domain):
         # unless we don't even have an entry without :nolist:
         for config_entry in data_config:
             master_configs.setdefault(config_entry.fullname, config_entry)
+        # configs from other projects can be included as well
+        external_configs = self.external_configs
+        for name, config_entry in external_configs.items():
+            master_configs.setdefault(name, config_entry)
+        self._config_trie = NameTrie(master_configs.keys())
+        # copy the includes with expanded glob patterns,
+        # such that self.data keeps the includes as they were defined
+        for name, config_entry in master_configs.items():
+            includes = self._expand_includes(config_entry.includes)
+            master_configs[name] = config_entry._replace(includes=includes)
+
+        for name in external_configs:
+            master = master_configs[name]
+            if master.docname is None:
+                master.includes[:] = [incl for incl in master.includes if incl in master_configs]
 
         # collect the includes from other entries in `data_config`
         # and make sure that we only have valid includes
+        # (the ConsistencyChecker warns about unknown includes)
         for config_entry in data_config:
             name = config_entry.fullname
             master = master_configs[name]
-            for incl in config_entry.includes[:]:
+            for incl in self._expand_includes(config_entry.includes):
                 if incl not in master_configs:
-                    logger.warning(
-                        "config '%s' defined in %s, line %d includes "
-                        "unknown (not indexed) config '%s'", name, config_entry.source,
-                        config_entry.line, incl)
                     try:
                         master.includes.remove(incl)
                     except ValueError:
@@ -662,17 +1658,37 @@ class CfgDomain(Domain):
             handled_recursive = set([])
             for config in master_configs.keys():
                 self._set_recursive_include(config, handled_recursive)
-        always_include = self.env.config.cfg_options_always_include
+        always_include = self._expand_includes(self.env.config.cfg_options_always_include)
         for incl in always_include:
             for master in master_configs.values():
                 if incl not in master.includes:
                     master.includes.append(incl)
         return master_configs
 
+    def _expand_includes(self, includes):
+        """Replace glob patterns like ``Solver*`` in `includes` by the matching config names."""
+        expanded = []
+        for incl in includes:
+            if is_glob_pattern(incl):
+                matches = self._config_trie.match(incl)
+            else:
+                matches = [incl]
+            for match in matches:
+                if match not in expanded:
+                    expanded.append(match)
+        return expanded
+
+    def _merged_config2options(self):
+        """dict config_name -> List[OptionEntry] from the inventories and self.data."""
+        config2options = self.external_config2options.copy()
+        for config, options in self.data['config2options'].items():
+            config2options[config] = config2options.get(config, []) + options
+        return config2options
+
     def _build_config_options(self):
         master_configs = self.master_configs
         self._config_options = config_options = {}
-        data_config2options = self.data['config2options']
+        data_config2options = self._merged_config2options()
         config_names = set(master_configs.keys()).union(set(data_config2options.keys()))
         self._all_config_options = {}
         for config in config_names:
@@ -680,14 +1696,9 @@ class CfgDomain(Domain):
             master_config = master_configs.get(config, None)
             if master_config:
                 includes = master_config.includes
-            else:  # config not in master_config, i.e. no config of that name indexed
-                # => config likely only defined through an option directive!
-                for option in data_config2options.get(config, []):
-                    assert option.config == config
-                    logger.warning(
-                        "`cfg:option` '%s' in %s, line %d, belongs to a"
-                        " non-indexed, unknown config %s (-> Typo?)", option.dispname,
-                        option.source, option.line, option.config)
+            # else: config not in master_config, i.e. no config of that name indexed
+            # => config likely only defined through an option directive;
+            # the ConsistencyChecker warns about it
 
             prio = dict((incl, i) for i, incl in enumerate(includes))
 
@@ -702,13 +1713,7 @@ class CfgDomain(Domain):
             self._all_config_options[config] = options
 
             if self.env.config.cfg_options_unique:
-                new_options = []
-                last = ""
-                for option in options:
-                    if option.dispname != last:
-                        new_options.append(option)
-                    last = option.dispname
-                options = new_options
+                options = _unique_options(options)
 
             config_options[config] = options
 
@@ -729,6 +1734,405 @@ class CfgDomain(Domain):
         return new_includes
 
 
+INVENTORY_VERSION = 1
+
+
+def load_inventory(filename):
+    """Load a cfg inventory written by :func:`write_inventory`."""
+    with open(filename, encoding='utf-8') as f:
+        inventory = json.load(f)
+    if inventory.get('version', None) != INVENTORY_VERSION:
+        raise ValueError("unsupported cfg inventory version %r" % inventory.get('version', None))
+    return inventory
+
+
+def write_inventory(app, exception):
+    """Export the configs and options of this project to `cfg_options_inventory_file`.
+
+    Connected to the ``build-finished`` event. The inventory is a compact JSON file, which
+    other projects can import with `cfg_options_inventories`. It contains the URIs, the
+    resolved includes, and for each option the context, default and summary::
+
+        {"version": 1, "project": ...,
+         "configs": {config: [uri, includes]},
+         "options": {config: [[name, uri, context, default, summary, cropped, type], ...]}}
+    """
+    filename = app.config.cfg_options_inventory_file
+    if exception is not None or not filename or app.builder.format != 'html':
+        return
+    builder = app.builder
+    domain = app.env.get_domain('cfg')
+    configs = {}
+    for name, config_entry in domain.master_configs.items():
+        if config_entry.docname is None:
+            continue  # imported from another inventory
+        uri = builder.get_target_uri(config_entry.docname) + '#' + config_entry.anchor
+        configs[name] = [uri, config_entry.includes[1:]]
+    options = {}
+    for config, option_entries in domain.data['config2options'].items():
+        options[config] = [[
+            option.dispname,
+            builder.get_target_uri(option.docname) + '#' + option.anchor,
+            option.context,
+            option.default,
+            option.summary,
+            option.summarycropped,
+            option.typ,
+        ] for option in option_entries]
+    inventory = {
+        'version': INVENTORY_VERSION,
+        'project': app.config.project,
+        'configs': configs,
+        'options': options,
+    }
+    with open(os.path.join(app.outdir, filename), 'w', encoding='utf-8') as f:
+        json.dump(inventory, f, separators=(',', ':'))
+
+
+def check_inventories_outdated(app, env, added, changed, removed):
+    """Re-read all documents if an imported cfg inventory changed.
+
+    Connected to the ``env-get-outdated`` event.
+    """
+    mtimes = {}
+    for base_uri, filename in app.config.cfg_options_inventories.values():
+        filename = os.path.join(app.confdir, filename)
+        mtimes[filename] = os.path.getmtime(filename) if os.path.exists(filename) else None
+    data = env.domaindata['cfg']
+    if data['inventories'] == mtimes:
+        return []
+    data['inventories'] = mtimes
+    return sorted(env.found_docs - added - changed - removed)
+
+
+SEARCH_PAGE_NAME = 'cfg-search'
+SEARCH_PAGE_LABEL = 'cfg-option-search'
+SEARCH_DATA_DIR = '_cfg_search'
+SEARCH_PREFIX_LEN = 2
+search_split_re = re.compile(r"""[\s._,:`'"()\[\]]+""")
+search_shard_key_re = re.compile(r"[^a-z0-9]")
+
+SEARCH_PAGE_BODY = """
+<h1>Config Option Search</h1>
+<p>Search for (the beginning of) option names, config names, types or default values.
+Multiple words have to match all.</p>
+<p><input type="text" id="cfg-search-input" size="40" autocomplete="off" autofocus/></p>
+<p id="cfg-search-status"></p>
+<ul id="cfg-search-results"></ul>
+<script>
+(function() {
+  var dataRoot = "%(data_root)s", prefixLen = %(prefix_len)d, maxResults = 200;
+  var shards = {};
+  var input = document.getElementById("cfg-search-input");
+  var statusNode = document.getElementById("cfg-search-status");
+  var resultsNode = document.getElementById("cfg-search-results");
+  function shardKey(word) {
+    return word.slice(0, prefixLen).replace(/[^a-z0-9]/g, "_");
+  }
+  function loadShard(key) {
+    if (!(key in shards)) {
+      shards[key] = fetch(dataRoot + key + ".json").then(function(response) {
+        return response.ok ? response.json() : {tokens: [], records: []};
+      });
+    }
+    return shards[key];
+  }
+  function render(query, records) {
+    resultsNode.innerHTML = "";
+    records.slice(0, maxResults).forEach(function(r) {
+      // r = [name, config, type, default, uri, summary]
+      var li = document.createElement("li"), a = document.createElement("a");
+      a.href = r[4];
+      a.textContent = r[1] + "." + r[0];
+      li.appendChild(a);
+      var text = (r[2] ? " : " + r[2] : "") + (r[3] ? " = " + r[3] : "") +
+                 (r[5] ? " \u2014 " + r[5] : "");
+      li.appendChild(document.createTextNode(text));
+      resultsNode.appendChild(li);
+    });
+    statusNode.textContent = records.length + " options found" +
+      (records.length > maxResults ? ", showing the first " + maxResults : "");
+  }
+  function search() {
+    var query = input.value.toLowerCase().trim();
+    var words = query.split(/[\\s._,:`'"()\\[\\]]+/).filter(function(w) { return w; });
+    // the longest word selects the shard, all words filter the records
+    var first = words.reduce(function(a, b) { return b.length > a.length ? b : a; }, "");
+    if (first.length < prefixLen) {
+      resultsNode.innerHTML = "";
+      statusNode.textContent = "";
+      return;
+    }
+    loadShard(shardKey(first)).then(function(shard) {
+      if (input.value.toLowerCase().trim() !== query) return;  // outdated
+      var found = {}, records = [];
+      shard.tokens.forEach(function(t) {
+        if (t[0].lastIndexOf(first, 0) !== 0) return;
+        t[1].forEach(function(i) {
+          if (found[i]) return;
+          found[i] = true;
+          var r = shard.records[i];
+          var text = (r[0] + " " + r[1] + " " + r[2] + " " + r[3]).toLowerCase();
+          if (words.every(function(w) { return text.indexOf(w) >= 0; })) records.push(r);
+        });
+      });
+      render(query, records);
+    });
+  }
+  input.addEventListener("input", search);
+  var params = new URLSearchParams(window.location.search);
+  if (params.get("q")) { input.value = params.get("q"); search(); }
+})();
+</script>
+"""
+
+
+def note_search_page_label(app, env, docnames):
+    """Define the label `cfg-option-search` only if the search page is generated.
+
+    Connected to the ``env-before-read-docs`` event, which is emitted in every build.
+    """
+    std = env.get_domain('std')
+    if app.config.cfg_options_search_page:
+        std.note_hyperlink_target(SEARCH_PAGE_LABEL, SEARCH_PAGE_NAME, '', 'Config Option Search')
+    else:
+        std.labels.pop(SEARCH_PAGE_LABEL, None)
+        std.anonlabels.pop(SEARCH_PAGE_LABEL, None)
+
+
+def collect_search_page(app):
+    """Generate the config option search page and its sharded prefix index.
+
+    Connected to the ``html-collect-pages`` event. Each option is indexed by its name,
+    the parts of its name, its config, type and default value. The tokens are sharded by
+    their first `SEARCH_PREFIX_LEN` characters into ``_cfg_search/<prefix>.json`` files,
+    such that the browser only needs to load the shard for the queried prefix.
+    """
+    if not app.config.cfg_options_search_page:
+        return
+    builder = app.builder
+    domain = app.env.get_domain('cfg')
+    shards = {}  # shard key -> (dict token -> set of record indices, records, record indices)
+    all_options = [option for options in domain.data['config2options'].values()
+                   for option in options]
+    for n, option in enumerate(all_options):
+        uri = builder.get_relative_uri(SEARCH_PAGE_NAME, option.docname) + '#' + option.anchor
+        record = [option.dispname, option.config, option.typ.strip(), option.default, uri,
+                  option.summary + (" ..." if option.summarycropped else "")]
+        tokens = set([option.dispname.lower(), option.config.lower()])
+        for text in (option.dispname, option.config, option.typ, option.default):
+            tokens.update(search_split_re.split(text.lower()))
+        for token in tokens:
+            if len(token) < SEARCH_PREFIX_LEN:
+                continue
+            key = search_shard_key_re.sub('_', token[:SEARCH_PREFIX_LEN])
+            shard_tokens, records, record_ids = shards.setdefault(key, ({}, [], {}))
+            i = record_ids.get(n, None)
+            if i is None:
+                i = record_ids[n] = len(records)
+                records.append(record)
+            shard_tokens.setdefault(token, set()).add(i)
+    outdir = os.path.join(app.outdir, SEARCH_DATA_DIR)
+    os.makedirs(outdir, exist_ok=True)
+    for filename in os.listdir(outdir):  # remove outdated shards
+        if filename.endswith('.json'):
+            os.remove(os.path.join(outdir, filename))
+    for key, (shard_tokens, records, _) in shards.items():
+        shard = {
+            'tokens': [[token, sorted(ids)] for token, ids in sorted(shard_tokens.items())],
+            'records': records,
+        }
+        with open(os.path.join(outdir, key + '.json'), 'w', encoding='utf-8') as f:
+            json.dump(shard, f, separators=(',', ':'))
+    depth = builder.get_target_uri(SEARCH_PAGE_NAME).count('/')
+    context = {
+        'title': "Config Option Search",
+        'body': SEARCH_PAGE_BODY % {
+            'data_root': '../' * depth + SEARCH_DATA_DIR + '/',
+            'prefix_len': SEARCH_PREFIX_LEN,
+        },
+    }
+    yield (SEARCH_PAGE_NAME, context, 'page.html')
+
+
+def suggest_missing_reference(app, env, node, contnode):
+    """Warn about unresolved ``:cfg:config:`` and ``:cfg:option:`` references.
+
+    Connected to the ``missing-reference`` event, which is emitted if
+    :meth:`CfgDomain.resolve_xref` returns None. Suggests the most similar existing names.
+    """
+    if node.get('refdomain') != 'cfg':
+        return None
+    if node.get('cfg:implicit', False):
+        node['cfg:warned'] = True  # already reported once by the ConsistencyChecker
+        return None
+    if env.config.nitpicky and sphinx.version_info < (3, 4):
+        return None  # sphinx warns anyways, and there is no `warn-missing-reference` to skip it
+    typ = node['reftype']
+    target = node['reftarget']
+    domain = env.get_domain('cfg')
+    if typ == "option" and node.get('cfg:config', None) and '.' not in target:
+        target = node['cfg:config'] + '.' + target  # relative to the current config
+    suggestions = domain.similarity_index(typ).suggest(target)
+    if suggestions:
+        logger.warning("unknown cfg:%s reference %r, did you mean %s?", typ, target,
+                       " or ".join(repr(s) for s in suggestions), location=node,
+                       type='cfg', subtype='missing-reference')
+    else:
+        logger.warning("unknown cfg:%s reference %r", typ, target, location=node,
+                       type='cfg', subtype='missing-reference')
+    node['cfg:warned'] = True  # replaces the nitpicky warning, see `skip_warned_reference`
+    return None
+
+
+def skip_warned_reference(app, domain, node):
+    """Suppress Sphinx' nitpicky warning for references :func:`suggest_missing_reference` warned.
+
+    Connected to the ``warn-missing-reference`` event.
+    """
+    if node.get('cfg:warned', False):
+        return True
+    return None
+
+
+lint_directive_re = re.compile(r"^(\s*)\.\.\s+cfg:([\w-]+)\s*::\s*(.*?)\s*$")
+lint_option_re = re.compile(r"^:([\w-]+):\s*(.*?)\s*$")
+
+
+class CfgLinter:
+    """Check the cfg directives in rst files and python docstrings without running Sphinx.
+
+    Finds unparsable option header lines, unknown configs in ``:config:`` and
+    ``.. cfg:configoptions::``, and unknown configs or unmatched patterns in ``:include:``.
+    Configs are known if they are defined in the checked files or in `known_configs`,
+    e.g. from the `cfg_inventory.json` of the last build. See :func:`main`.
+    """
+    def __init__(self, known_configs=(), comma_sep=False):
+        self.trie = NameTrie(known_configs)
+        self.header_re = option_header_re_comma_sep if comma_sep else option_header_re
+        self.problems = []  # (filename, line, message)
+        self.config_refs = []  # (filename, line, config, is_include), checked in `finish()`
+
+    def lint_file(self, filename):
+        try:
+            with open(filename, encoding='utf-8') as f:
+                lines = f.read().splitlines()
+        except (OSError, ValueError) as e:
+            self.problems.append((filename, 0, "can't read the file: %s" % e))
+            return
+        for i, line in enumerate(lines):
+            m = lint_directive_re.match(line)
+            if m is None:
+                continue
+            indent = len(m.group(1))
+            j = i + 1
+            while j < len(lines) and (not lines[j].strip() or _get_indent(lines[j]) > indent):
+                j += 1
+            # nested directives are found in later iterations of the loop
+            self.lint_directive(filename, i + 1, m.group(2), m.group(3), lines[i + 1:j])
+
+    def lint_directive(self, filename, lineno, directive, argument, block):
+        options = {}
+        k = 0
+        for k, line in enumerate(block):
+            m = lint_option_re.match(line.strip())
+            if m is None:
+                break
+            options[m.group(1)] = m.group(2)
+        else:
+            k = len(block)
+        if directive in ['config', 'config-from']:
+            name = argument
+            if directive == 'config-from':
+                name = self.config_from_name(filename, argument, options.get('config', None))
+            if 'noindex' not in options:
+                self.trie.add(name)
+            for incl in options.get('include', "").split(','):
+                if incl.strip():
+                    self.config_refs.append((filename, lineno, incl.strip(), True))
+        elif directive == 'configoptions':
+            self.config_refs.append((filename, lineno, argument, False))
+        elif directive == 'option' and 'config' in options:
+            self.config_refs.append((filename, lineno + 1, options['config'], False))
+        if directive in ['config', 'configoptions'] and 'noparse' not in options:
+            content = block[k:]
+            indents = [_get_indent(line) for line in content if line.strip()]
+            if indents:
+                dedent = min(indents)
+                content = [line[dedent:] for line in content]
+                for field_beg, _, m in _find_option_fields(content, self.header_re):
+                    if m is None:
+                        self.problems.append((filename, lineno + 1 + k + field_beg,
+                                              "can't parse config option header-line %r" %
+                                              content[field_beg]))
+
+    def config_from_name(self, filename, schema_filename, config_option):
+        """Name of the config defined by a ``cfg:config-from``, like :class:`CfgConfigFrom`."""
+        schema_filename = os.path.join(os.path.dirname(filename), schema_filename)
+        title = ""
+        if not config_option:
+            try:
+                title, _ = load_schema(schema_filename)
+            except (OSError, ValueError, ImportError):
+                pass  # fall back to the basename
+        return _config_from_name(config_option, title, schema_filename)
+
+    def finish(self):
+        """Check the collected config names and return the sorted list of problems."""
+        similarity_index = None
+        for filename, lineno, config, is_include in self.config_refs:
+            if is_glob_pattern(config):
+                if not self.trie.match(config):
+                    self.problems.append((filename, lineno,
+                                          "include pattern '%s' matches no config" % config))
+                continue
+            if config in self.trie:
+                continue
+            if similarity_index is None:
+                similarity_index = SimilarityIndex(self.trie.startswith(""))
+            message = "%s unknown config '%s'" % ("includes" if is_include else "uses", config)
+            suggestions = similarity_index.suggest(config)
+            if suggestions:
+                message += ", did you mean %s?" % " or ".join(repr(s) for s in suggestions)
+            self.problems.append((filename, lineno, message))
+        return sorted(self.problems)
+
+
+def main(argv=None):
+    """Command line entry point of the :class:`CfgLinter`.
+
+    Run ``python sphinx_cfg_options.py --help`` for the usage. Returns the exit code.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(
+        description="Check cfg directives in rst files and python docstrings without Sphinx.")
+    parser.add_argument('files', nargs='+', help="rst or python files to check")
+    parser.add_argument('--inventory',
+                        default=os.path.join('build', 'html', 'cfg_inventory.json'),
+                        help="cfg_inventory.json of the last build, defining the known configs "
+                        "(default: %(default)s, ignored if it doesn't exist)")
+    parser.add_argument('--comma-sep', action='store_true',
+                        help="allow ','-separated option names, "
+                        "like `cfg_options_parse_comma_sep_names`")
+    args = parser.parse_args(argv)
+    known_configs = []
+    inventory_problems = []
+    if os.path.exists(args.inventory):
+        try:
+            known_configs = load_inventory(args.inventory)['configs'].keys()
+        except (OSError, ValueError, KeyError) as e:
+            inventory_problems.append((args.inventory, 0,
+                                       "can't load the cfg inventory: %s" % e))
+    linter = CfgLinter(known_configs, args.comma_sep)
+    linter.problems.extend(inventory_problems)
+    for filename in args.files:
+        linter.lint_file(filename)
+    problems = linter.finish()
+    for filename, lineno, message in problems:
+        print("{0!s}:{1!s}: {2!s}".format(filename, lineno, message))
+    return 1 if problems else 0
+
+
 def setup(app):
     app.add_event('cfg_options-parse_config')
     app.add_config_value('cfg_options_recursive_includes', True, 'html')
@@ -739,11 +2143,27 @@ def setup(app):
     app.add_config_value('cfg_options_default_in_summary_table', True, 'html')
     app.add_config_value('cfg_options_unique', True, 'html')
     app.add_config_value('cfg_options_always_include', [], 'html')
+    app.add_config_value('cfg_options_summary_dedup_threshold', None, 'html')
+    app.add_config_value('cfg_options_diagnostics_file', None, 'html')
+    app.add_config_value('cfg_options_inventory_file', "cfg_inventory.json", 'html')
+    app.add_config_value('cfg_options_inventories', {}, 'env')
+    app.add_config_value('cfg_options_search_page', False, 'html')
+    app.add_config_value('cfg_options_index_pages', None, 'html')
+    app.add_config_value('cfg_options_catalog_db', None, 'html')
 
     app.add_domain(CfgDomain)
 
     app.add_node(cfgconfig)
     app.connect('doctree-resolved', ConfigNodeProcessor)
+    app.connect('env-check-consistency', ConsistencyChecker)
+    app.connect('missing-reference', suggest_missing_reference)
+    if sphinx.version_info >= (3, 4):
+        app.connect('warn-missing-reference', skip_warned_reference)
+    app.connect('env-get-outdated', check_inventories_outdated)
+    app.connect('build-finished', write_inventory)
+    app.connect('env-before-read-docs', note_search_page_label)
+    app.connect('html-collect-pages', collect_search_page)
+    app.connect('html-collect-pages', collect_index_pages)
 
     StandardDomain.initial_data['labels']['cfg-config-index'] =\
         ('cfg-config', '', 'Config Index')
@@ -751,3 +2171,7 @@ def setup(app):
         ('cfg-option', '', 'Config-Options Index')
 
     return {'version': '0.1'}
+
+
+if __name__ == '__main__':
+    sys.exit(main())